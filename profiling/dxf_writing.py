@@ -0,0 +1,48 @@
+#  Copyright (c) 2023, Manfred Moitzi
+#  License: MIT License
+import io
+import time
+import tempfile
+import pathlib
+import ezdxf
+from ezdxf.document import Drawing
+
+# Compares the DXF export into memory with the export into a file, the
+# difference is the cost of the text encoding and the disk I/O.
+ENTITY_COUNT = 30_000
+
+
+def create_doc() -> Drawing:
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for index in range(ENTITY_COUNT):
+        msp.add_line((index, 0, 0), (index, 1, 2), dxfattribs={"layer": "LINES"})
+        msp.add_text("TEXT", dxfattribs={"layer": "TEXT", "height": 2.5})
+    return doc
+
+
+def write_memory(doc: Drawing):
+    doc.write(io.StringIO())
+
+
+def save_file(doc: Drawing, filename: pathlib.Path):
+    doc.saveas(filename)
+
+
+def print_result(time, text):
+    print(f"Operation: {text} takes {time:.3f} s\n")
+
+
+def run(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    end = time.perf_counter()
+    return end - start
+
+
+if __name__ == "__main__":
+    doc = create_doc()
+    with tempfile.TemporaryDirectory() as folder:
+        filename = pathlib.Path(folder) / "profiling.dxf"
+        print_result(run(write_memory, doc), "export to StringIO")
+        print_result(run(save_file, doc, filename), "export to file")
@@ -13,6 +13,7 @@ from typing import (
     List,
     Tuple,
     Optional,
+    Callable,
 )
 from typing_extensions import TypeAlias
 import math
@@ -47,11 +48,38 @@ class Token(NamedTuple):
 
 SabRecord: TypeAlias = List[Token]
 
+# Prebuilt struct unpackers, avoids parsing the format string for each token:
+_unpack_int = struct.Struct("<i").unpack_from
+_unpack_double = struct.Struct("<d").unpack_from
+_unpack_floats: dict[int, Callable[..., tuple[float, ...]]] = {
+    3: struct.Struct("<3d").unpack_from
+}
+
+# bytes.startswith() tests all signatures in a single call, all signatures
+# have the same length:
+_SIGNATURES = tuple(const.SIGNATURES)
+_SIGNATURE_LENGTH = len(const.ACIS_SIGNATURE)
+
 
 class Decoder:
     def __init__(self, data: bytes):
         self.data = data
         self.index: int = 0
+        # Readers for all tags which store a single value token, the control
+        # tags are processed in Decoder.read_record():
+        self._value_readers: dict[int, Callable[[], Any]] = {
+            Tags.INT: self.read_int,
+            Tags.DOUBLE: self.read_float,
+            Tags.STR: lambda: self.read_str(self.read_byte()),
+            Tags.POINTER: self.read_int,
+            Tags.BOOL_TRUE: lambda: True,
+            Tags.BOOL_FALSE: lambda: False,
+            Tags.LITERAL_STR: lambda: self.read_str(self.read_int()),
+            Tags.LOCATION_VEC: lambda: self.read_floats(3),
+            Tags.DIRECTION_VEC: lambda: self.read_floats(3),
+            Tags.ENUM: self.read_int,
+            Tags.UNKNOWN_0x17: self.read_float,
+        }
 
     @property
     def has_data(self) -> bool:
@@ -59,12 +87,9 @@ class Decoder:
 
     def read_header(self) -> AcisHeader:
         header = AcisHeader()
-        for signature in const.SIGNATURES:
-            if self.data.startswith(signature):
-                self.index = len(signature)
-                break
-        else:
+        if not self.data.startswith(_SIGNATURES):
             raise ParsingError("not a SAB file")
+        self.index = _SIGNATURE_LENGTH
         header.version = self.read_int()
         header.n_records = self.read_int()
         header.n_entities = self.read_int()
@@ -94,20 +119,28 @@ class Decoder:
 
     def read_int(self) -> int:
         pos = self.forward(4)
-        values = struct.unpack_from("<i", self.data, pos)[0]
-        return values
+        return _unpack_int(self.data, pos)[0]
 
     def read_float(self) -> float:
         pos = self.forward(8)
-        return struct.unpack_from("<d", self.data, pos)[0]
+        return _unpack_double(self.data, pos)[0]
 
     def read_floats(self, count: int) -> Sequence[float]:
         pos = self.forward(8 * count)
-        return struct.unpack_from(f"<{count}d", self.data, pos)
+        try:
+            unpack = _unpack_floats[count]
+        except KeyError:
+            unpack = struct.Struct(f"<{count}d").unpack_from
+            _unpack_floats[count] = unpack
+        return unpack(self.data, pos)
 
     def read_str(self, length) -> str:
-        text = self.read_bytes(length)
-        return text.decode()
+        # A memoryview is slower than slicing for the short strings of SAB
+        # files, the bytes slice is decoded immediately:
+        pos = self.index
+        end = pos + length
+        self.index = end
+        return self.data[pos:end].decode()
 
     def read_str_tag(self) -> str:
         tag = self.read_byte()
@@ -128,6 +161,8 @@ class Decoder:
         values: SabRecord = []
         entity_type: list[str] = []
         subtype_level: int = 0
+        get_reader = self._value_readers.get
+        append = values.append
         while True:
             if not self.has_data:
                 if values:
@@ -136,34 +171,15 @@ class Decoder:
                         return values
                 raise ParsingError("pre-mature end of data")
             tag = self.read_byte()
-            if tag == Tags.INT:
-                values.append(Token(tag, self.read_int()))
-            elif tag == Tags.DOUBLE:
-                values.append(Token(tag, self.read_float()))
-            elif tag == Tags.STR:
-                values.append(Token(tag, self.read_str(self.read_byte())))
-            elif tag == Tags.POINTER:
-                values.append(Token(tag, self.read_int()))
-            elif tag == Tags.BOOL_TRUE:
-                values.append(Token(tag, True))
-            elif tag == Tags.BOOL_FALSE:
-                values.append(Token(tag, False))
-            elif tag == Tags.LITERAL_STR:
-                values.append(Token(tag, self.read_str(self.read_int())))
+            reader = get_reader(tag)
+            if reader is not None:
+                append(Token(tag, reader()))
             elif tag == Tags.ENTITY_TYPE_EX:
                 entity_type.append(self.read_str(self.read_byte()))
             elif tag == Tags.ENTITY_TYPE:
                 entity_type.append(self.read_str(self.read_byte()))
                 values.append(Token(tag, entity_name()))
                 entity_type.clear()
-            elif tag == Tags.LOCATION_VEC:
-                values.append(Token(tag, self.read_floats(3)))
-            elif tag == Tags.DIRECTION_VEC:
-                values.append(Token(tag, self.read_floats(3)))
-            elif tag == Tags.ENUM:
-                values.append(Token(tag, self.read_int()))
-            elif tag == Tags.UNKNOWN_0x17:
-                values.append(Token(tag, self.read_float()))
             elif tag == Tags.SUBTYPE_START:
                 subtype_level += 1
                 values.append(Token(tag, subtype_level))
@@ -354,25 +370,34 @@ def resolve_pointers(entities: list[SabEntity]) -> list[SabEntity]:
             return NULL_PTR
         return entities[num]
 
+    # comparing int to int is faster than comparing int to IntEnum:
+    pointer = int(Tags.POINTER)
     for entity in entities:
         entity.attributes = ptr(entity.attr_ptr)
         entity.attr_ptr = -1
-        for index, token in enumerate(entity.data):
-            if token.tag == Tags.POINTER:
-                entity.data[index] = Token(token.tag, ptr(token.value))
+        data = entity.data
+        for index, token in enumerate(data):
+            if token.tag == pointer:
+                data[index] = Token(pointer, ptr(token.value))
     return entities
 
 
-def parse_sab(data: Union[bytes, bytearray]) -> SabBuilder:
+def parse_sab(data: Union[bytes, bytearray, memoryview]) -> SabBuilder:
     """Returns the :class:`SabBuilder` for the ACIS :term:`SAB` file content
-    given as string or list of strings.
+    given as bytes, bytearray or any other object which supports the buffer
+    protocol like :class:`memoryview` or :class:`mmap.mmap`.
 
     Raises:
         ParsingError: invalid or unsupported ACIS data structure
 
     """
     if not isinstance(data, (bytes, bytearray)):
-        raise TypeError("expected bytes, bytearray")
+        # The Decoder requires bytes slicing, which is faster for the short
+        # strings of SAB files than slicing a memoryview:
+        try:
+            data = memoryview(data).tobytes()
+        except TypeError:
+            raise TypeError("expected bytes, bytearray or a buffer object")
     builder = SabBuilder()
     decoder = Decoder(data)
     builder.header = decoder.read_header()
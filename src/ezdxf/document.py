@@ -62,7 +62,7 @@ from ezdxf.tools.text import safe_string, MAX_STR_LEN
 logger = logging.getLogger("ezdxf")
 
 if TYPE_CHECKING:
-    from ezdxf.entities import DXFEntity, Layer, VPort, Dictionary
+    from ezdxf.entities import DXFEntity, VPort, Dictionary
     from ezdxf.eztypes import GenericLayoutType
     from ezdxf.layouts import Layout
     from ezdxf.lldxf.tags import Tags
@@ -84,6 +84,9 @@ CONST_MARKER_STRING = "0.0 @ 2000-01-01T00:00:00.000000+00:00"
 CREATED_BY_EZDXF = "CREATED_BY_EZDXF"
 WRITTEN_BY_EZDXF = "WRITTEN_BY_EZDXF"
 EZDXF_META = "EZDXF_META"
+# DXF export writes many small tags, a large file buffer reduces the count of
+# write calls to the OS:
+FILE_BUFFER_SIZE = 1 << 20
 
 
 def _validate_handle_seed(seed: str) -> str:
@@ -100,13 +103,18 @@ def _validate_handle_seed(seed: str) -> str:
     return seed
 
 
+def _normalize_dxf_version(version: str) -> str:
+    """Returns the DXF version string for `version`, translates AutoCAD release
+    names like "R12" to DXF versions like "AC1009".
+    """
+    version = version.upper()
+    return const.acad_release_to_dxf_version.get(version, version)
+
+
 class Drawing:
     def __init__(self, dxfversion=DXF2013) -> None:
         self.entitydb = EntityDB()
-        target_dxfversion = dxfversion.upper()
-        self._dxfversion: str = const.acad_release_to_dxf_version.get(
-            target_dxfversion, target_dxfversion
-        )
+        self._dxfversion: str = _normalize_dxf_version(dxfversion)
         if self._dxfversion not in const.versions_supported_by_new:
             raise const.DXFVersionError(f'Unsupported DXF version "{self.dxfversion}".')
         # Store original dxf version if loaded (and maybe converted R13/14)
@@ -130,7 +138,18 @@ class Drawing:
         # DXF sections
         self.header: HeaderSection = None  # type: ignore
         self.classes: ClassesSection = None  # type: ignore
-        self.tables: TablesSection = None  # type: ignore
+        self._tables: TablesSection = None  # type: ignore
+        # Direct references to the resource tables, these tables are accessed
+        # very often and the TABLES section never replaces its tables:
+        self._layers: LayerTable = None  # type: ignore
+        self._linetypes: LinetypeTable = None  # type: ignore
+        self._styles: TextstyleTable = None  # type: ignore
+        self._dimstyles: DimStyleTable = None  # type: ignore
+        self._ucs: UCSTable = None  # type: ignore
+        self._appids: AppIDTable = None  # type: ignore
+        self._views: ViewTable = None  # type: ignore
+        self._block_records: BlockRecordTable = None  # type: ignore
+        self._viewports: ViewportTable = None  # type: ignore
         self.blocks: BlocksSection = None  # type: ignore
         self.entities: EntitySection = None  # type: ignore
         self.objects: ObjectsSection = None  # type: ignore
@@ -152,7 +171,8 @@ class Drawing:
 
         # DIMENSION rendering engine can be replaced by a custom Dimension
         # render: see property Drawing.dimension_renderer
-        self._dimension_renderer = DimensionRenderer()
+        # The default renderer is created on first use:
+        self._dimension_renderer: Optional[DimensionRenderer] = None
 
         # Some fixes can't be applied while the DXF document is not fully
         # initialized, store this fixes as callable object:
@@ -215,44 +235,36 @@ class Drawing:
         self._create_required_dimstyles()
 
     def _set_required_layer_attributes(self):
-        for layer in self.layers:  # type: Layer
-            layer.set_required_attributes()
+        self.layers.set_required_attributes()
 
     def _create_required_vports(self):
-        if "*Active" not in self.viewports:
-            self.viewports.new("*Active")
+        self.viewports.ensure("*Active")
 
     def _create_required_appids(self):
-        if "ACAD" not in self.appids:
-            self.appids.new("ACAD")
+        self.appids.ensure("ACAD")
 
     def _create_required_linetypes(self):
         linetypes = self.linetypes
         for name in ("ByBlock", "ByLayer", "Continuous"):
-            if name not in linetypes:
-                linetypes.new(name)
+            linetypes.ensure(name)
 
     def _create_required_dimstyles(self):
-        if "Standard" not in self.dimstyles:
-            self.dimstyles.new("Standard")
+        self.dimstyles.ensure("Standard")
 
     def _create_required_styles(self):
-        if "Standard" not in self.styles:
-            self.styles.new("Standard")
+        self.styles.ensure("Standard")
 
     def _create_required_layers(self):
         layers = self.layers
-        if "0" not in layers:
-            layers.new("0")
-        if "Defpoints" not in layers:
-            layers.new("Defpoints", dxfattribs={"plot": 0})  # do not plot
-        else:
-            # AutoCAD requires a plot flag = 0
-            layers.get("Defpoints").dxf.plot = 0
+        layers.ensure("0")
+        # AutoCAD requires a plot flag = 0
+        layers.ensure("Defpoints", dxfattribs={"plot": 0}).dxf.plot = 0
 
     def _setup_metadata(self):
         self.header["$ACADVER"] = self.dxfversion
-        self.header["$TDCREATE"] = juliandate(datetime.now())
+        utc_now = datetime.now(timezone.utc)
+        self.header["$TDCREATE"] = juliandate(utc_now.astimezone())
+        self.header["$TDUCREATE"] = juliandate(utc_now)
         if self.header.get("$FINGERPRINTGUID", CONST_GUID) == CONST_GUID:
             self.reset_fingerprint_guid()
         if self.header.get("$VERSIONGUID", CONST_GUID) == CONST_GUID:
@@ -296,9 +308,7 @@ class Drawing:
             raise ValueError(f"Invalid units enum: {unit_enum}")
 
     def _validate_dxf_version(self, version: str) -> str:
-        version = version.upper()
-        # translates 'R12' -> 'AC1009'
-        version = const.acad_release_to_dxf_version.get(version, version)
+        version = _normalize_dxf_version(version)
         if version not in const.versions_supported_by_save:
             raise const.DXFVersionError(f'Unsupported DXF version "{version}".')
         if version == DXF12:
@@ -489,10 +499,8 @@ class Drawing:
             ARROWS.create_block(self.blocks, arrow_name)
 
     def _create_required_block_records(self):
-        if "*Model_Space" not in self.block_records:
-            self.block_records.new("*Model_Space")
-        if "*Paper_Space" not in self.block_records:
-            self.block_records.new("*Paper_Space")
+        self.block_records.ensure("*Model_Space")
+        self.block_records.ensure("*Paper_Space")
 
     def saveas(
         self,
@@ -531,19 +539,20 @@ class Drawing:
         # in ASCII mode, unknown characters will be escaped as \U+nnnn unicode
         # characters.
 
-        if encoding is None:
-            enc = self.output_encoding
-        else:
-            # override default encoding, for applications that handle encoding
-            # different than AutoCAD
-            enc = encoding
+        # override default encoding, for applications that handle encoding
+        # different than AutoCAD
+        enc = self.output_encoding if encoding is None else encoding
 
         if fmt.startswith("asc"):
             fp = io.open(
-                self.filename, mode="wt", encoding=enc, errors="dxfreplace"  # type: ignore
+                self.filename,  # type: ignore
+                mode="wt",
+                encoding=enc,
+                errors="dxfreplace",
+                buffering=FILE_BUFFER_SIZE,
             )
         elif fmt.startswith("bin"):
-            fp = open(self.filename, "wb")  # type: ignore
+            fp = open(self.filename, "wb", buffering=FILE_BUFFER_SIZE)  # type: ignore
         else:
             raise ValueError(f"Unknown output format: '{fmt}'.")
         try:
@@ -577,9 +586,8 @@ class Drawing:
         dxfversion = self.dxfversion
         if dxfversion == DXF12:
             handles = bool(self.header.get("$HANDLING", 0))
-        else:
+        else:  # DXF R2000+, older DXF versions are upgraded at loading stage
             handles = True
-        if dxfversion > DXF12:
             self.classes.add_required_classes(dxfversion)
 
         self._create_appids()
@@ -618,14 +626,14 @@ class Drawing:
 
     def export_sections(self, tagwriter: TagWriter) -> None:
         """DXF export sections. (internal API)"""
-        dxfversion = tagwriter.dxfversion
+        is_r2000_or_later = tagwriter.dxfversion > DXF12
         self.header.export_dxf(tagwriter)
-        if dxfversion > DXF12:
+        if is_r2000_or_later:
             self.classes.export_dxf(tagwriter)
         self.tables.export_dxf(tagwriter)
         self.blocks.export_dxf(tagwriter)
         self.entities.export_dxf(tagwriter)
-        if dxfversion > DXF12:
+        if is_r2000_or_later:
             self.objects.export_dxf(tagwriter)
         if self.acdsdata.is_valid:
             self.acdsdata.export_dxf(tagwriter)
@@ -676,8 +684,10 @@ class Drawing:
             self.header["$VERSIONGUID"] = CONST_GUID
             self.header["$FINGERPRINTGUID"] = CONST_GUID
         else:
-            now = datetime.now()
-            self.header["$TDUPDATE"] = juliandate(now)
+            # A single clock query for the local and the universal time:
+            utc_now = datetime.now(timezone.utc)
+            self.header["$TDUPDATE"] = juliandate(utc_now.astimezone())
+            self.header["$TDUUPDATE"] = juliandate(utc_now)
             self.reset_version_guid()
         self.header["$HANDSEED"] = str(self.entitydb.handles)  # next handle
         self.header["$DWGCODEPAGE"] = tocodepage(self.encoding)
@@ -699,8 +709,7 @@ class Drawing:
         ezdxf_meta[WRITTEN_BY_EZDXF] = ezdxf_marker_string()
 
     def _create_appid_if_not_exist(self, name: str, flags: int = 0) -> None:
-        if name not in self.appids:
-            self.appids.new(name, {"flags": flags})
+        self.appids.ensure(name, {"flags": flags})
 
     def _create_appids(self):
         self._create_appid_if_not_exist("HATCHBACKGROUNDCOLOR", 0)
@@ -711,41 +720,58 @@ class Drawing:
         """Returns the AutoCAD release abbreviation like "R12" or "R2000"."""
         return const.acad_release.get(self.dxfversion, "unknown")
 
+    @property
+    def tables(self) -> TablesSection:
+        return self._tables
+
+    @tables.setter
+    def tables(self, tables: TablesSection) -> None:
+        self._tables = tables
+        self._layers = tables.layers
+        self._linetypes = tables.linetypes
+        self._styles = tables.styles
+        self._dimstyles = tables.dimstyles
+        self._ucs = tables.ucs
+        self._appids = tables.appids
+        self._views = tables.views
+        self._block_records = tables.block_records
+        self._viewports = tables.viewports
+
     @property
     def layers(self) -> LayerTable:
-        return self.tables.layers
+        return self._layers
 
     @property
     def linetypes(self) -> LinetypeTable:
-        return self.tables.linetypes
+        return self._linetypes
 
     @property
     def styles(self) -> TextstyleTable:
-        return self.tables.styles
+        return self._styles
 
     @property
     def dimstyles(self) -> DimStyleTable:
-        return self.tables.dimstyles
+        return self._dimstyles
 
     @property
     def ucs(self) -> UCSTable:
-        return self.tables.ucs
+        return self._ucs
 
     @property
     def appids(self) -> AppIDTable:
-        return self.tables.appids
+        return self._appids
 
     @property
     def views(self) -> ViewTable:
-        return self.tables.views
+        return self._views
 
     @property
     def block_records(self) -> BlockRecordTable:
-        return self.tables.block_records
+        return self._block_records
 
     @property
     def viewports(self) -> ViewportTable:
-        return self.tables.viewports
+        return self._viewports
 
     @property
     def plotstyles(self) -> Dictionary:
@@ -753,7 +779,11 @@ class Drawing:
 
     @property
     def dimension_renderer(self) -> DimensionRenderer:
-        return self._dimension_renderer
+        renderer = self._dimension_renderer
+        if renderer is None:
+            renderer = DimensionRenderer()
+            self._dimension_renderer = renderer
+        return renderer
 
     @dimension_renderer.setter
     def dimension_renderer(self, renderer: DimensionRenderer) -> None:
@@ -812,11 +842,11 @@ class Drawing:
 
     def layout_names(self) -> Iterable[str]:
         """Returns all layout names in arbitrary order."""
-        return list(self.layouts.names())
+        return self.layouts.names()
 
     def layout_names_in_taborder(self) -> Iterable[str]:
         """Returns all layout names in tab-order, "Model" is always the first name."""
-        return list(self.layouts.names_in_taborder())
+        return self.layouts.names_in_taborder()
 
     def reset_fingerprint_guid(self):
         """Reset fingerprint GUID."""
@@ -843,9 +873,11 @@ class Drawing:
         (internal API)
         """
         self._acad_compatible = False
-        if msg not in self._acad_incompatibility_reason:
-            self._acad_incompatibility_reason.add(msg)
-            logger.warning(f"DXF document is not compatible to AutoCAD! {msg}.")
+        reasons = self._acad_incompatibility_reason
+        count = len(reasons)
+        reasons.add(msg)
+        if len(reasons) > count:  # log new messages only once
+            logger.warning("DXF document is not compatible to AutoCAD! %s.", msg)
 
     def query(self, query: str = "*") -> EntityQuery:
         """Entity query over all layouts and blocks, excluding the OBJECTS section and
@@ -882,6 +914,9 @@ class Drawing:
         """Chain entity spaces of all layouts and blocks. Yields an iterator
         for all entities in all layouts and blocks.
         """
+        # The snapshot of the layouts is cheap (one item per block definition)
+        # and makes it safe to create or delete block definitions while
+        # iterating the entities, the entities are not materialized:
         layouts = list(self.layouts_and_blocks())
         return chain.from_iterable(layouts)
 
@@ -318,64 +318,59 @@ class DXFNamespace:
 
         """
         if isinstance(attribs, str):
-            self._export_dxf_attribute_optional(tagwriter, attribs)
-        else:
-            for name in attribs:
-                self._export_dxf_attribute_optional(tagwriter, name)
-
-    def _export_dxf_attribute_optional(
-        self, tagwriter: AbstractTagWriter, name: str
-    ) -> None:
-        """Exports DXF attribute `name` by `tagwriter`. Optional tags are only
-        written if different to default value.
-
-        Args:
-            tagwriter: tag writer object
-            name: DXF attribute name
-
-        """
+            attribs = (attribs,)
+        # This is the hot path of the DXF export, localize all attributes and
+        # methods which are constant for all exported DXF attributes:
         export_dxf_version = tagwriter.dxfversion
         not_force_optional = not tagwriter.force_optional
-        attrib: Optional[DXFAttr] = self.dxfattribs.get(name)
-
-        if attrib:
+        write_tag = tagwriter.write_tag
+        get_attrib_def = self.dxfattribs.get
+        attrib_values = self.__dict__
+        for name in attribs:
+            attrib: Optional[DXFAttr] = get_attrib_def(name)
+            if attrib is None:
+                raise const.DXFAttributeError(
+                    ERR_INVALID_DXF_ATTRIB.format(name, self.dxftype)
+                )
+            # Do not export DXF attribs which are not supported by the DXF
+            # version of the tagwriter:
+            if export_dxf_version < attrib.dxfversion:
+                continue
+            # Same as self.get(name, None) but without redundant lookups:
+            if name in attrib_values:
+                value = attrib_values[name]
+            elif attrib.xtype == XType.callback:
+                value = attrib.get_callback_value(self._entity)
+            else:
+                value = None
             optional = attrib.optional
             default = attrib.default
-            value = self.get(name, None)
-            # Force default value e.g. layer
-            if value is None and not optional:
-                # Default value could be None
+            if value is None:
+                if optional:
+                    continue
+                # Force default value e.g. layer, default value could be None
                 value = default
-
-                # Do not export None values
-            if (value is not None) and (
-                export_dxf_version >= attrib.dxfversion
+                if value is None:  # Do not export None values
+                    continue
+            # Do not write explicit optional attribs if equal to default value
+            if (
+                optional
+                and not_force_optional
+                and default is not None
+                and default == value
             ):
-                # Do not write explicit optional attribs if equal to default
-                # value
-                if (
-                    optional
-                    and not_force_optional
-                    and default is not None
-                    and default == value
-                ):
-                    return
-                    # Just export x, y for 2D points, if value is a 3D point
-                if attrib.xtype == XType.point2d and len(value) > 2:
-                    try:  # Vec3
-                        value = (value.x, value.y)
-                    except AttributeError:
-                        value = value[:2]
-
-                if isinstance(value, str):
-                    assert "\n" not in value, "line break '\\n' not allowed"
-                    assert "\r" not in value, "line break '\\r' not allowed"
-                tag = dxftag(attrib.code, value)
-                tagwriter.write_tag(tag)
-        else:
-            raise const.DXFAttributeError(
-                ERR_INVALID_DXF_ATTRIB.format(name, self.dxftype)
-            )
+                continue
+            # Just export x, y for 2D points, if value is a 3D point
+            if attrib.xtype == XType.point2d and len(value) > 2:
+                try:  # Vec3
+                    value = (value.x, value.y)
+                except AttributeError:
+                    value = value[:2]
+
+            if isinstance(value, str):
+                assert "\n" not in value, "line break '\\n' not allowed"
+                assert "\r" not in value, "line break '\\r' not allowed"
+            write_tag(dxftag(attrib.code, value))
 
 
 BASE_CLASS_CODES = {0, 5, 102, 330}
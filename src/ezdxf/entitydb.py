@@ -133,11 +133,13 @@ class EntityDB:
 
     def keys(self) -> Iterable[str]:
         """Iterable of all handles, does filter destroyed entities."""
-        return (handle for handle, entity in self.items())
+        return (
+            handle for handle, entity in self._database.items() if entity.is_alive
+        )
 
     def values(self) -> Iterable[DXFEntity]:
         """Iterable of all entities, does filter destroyed entities."""
-        return (entity for handle, entity in self.items())
+        return (entity for entity in self._database.values() if entity.is_alive)
 
     def items(self) -> Iterable[tuple[str, DXFEntity]]:
         """Iterable of all (handle, entities) pairs, does filter destroyed
@@ -8,7 +8,7 @@ import pathlib
 
 from ezdxf.tools.standards import setup_drawing
 from ezdxf.lldxf.const import DXF2013
-from ezdxf.document import Drawing
+from ezdxf.document import Drawing, FILE_BUFFER_SIZE
 
 if TYPE_CHECKING:
     from ezdxf.lldxf.validator import DXFInfo
@@ -82,6 +82,12 @@ def read(stream: TextIO) -> Drawing:
     :class:`DXFStructureError` exception, try the :func:`ezdxf.recover.read`
     function to load this corrupt DXF document.
 
+    The DXF content is read line by line, a large read buffer speeds up
+    loading big DXF files::
+
+        with open(filename, "rt", encoding=encoding, buffering=1 << 20) as fp:
+            doc = ezdxf.read(fp)
+
     Args:
         stream: input text stream opened with correct encoding
 
@@ -149,7 +155,13 @@ def readfile(
     if encoding is not None:
         # override default encodings if absolute necessary
         info.encoding = encoding
-    with open(filename, mode="rt", encoding=info.encoding, errors=errors) as fp:  # type: ignore
+    with open(
+        filename,
+        mode="rt",
+        encoding=info.encoding,  # type: ignore
+        errors=errors,
+        buffering=FILE_BUFFER_SIZE,
+    ) as fp:
         doc = read(fp)  # type: ignore
 
     doc.filename = filename
@@ -141,10 +141,14 @@ def load_dxf_entities(
 def load_and_bind_dxf_content(sections: dict, doc: Drawing) -> None:
     # HEADER has no database entries.
     db = doc.entitydb
+    # localize functions
+    load = factory.load
+    bind = factory.bind
     for name in ["TABLES", "CLASSES", "ENTITIES", "BLOCKS", "OBJECTS"]:
         if name in sections:
             section = sections[name]
-            for index, entity in enumerate(load_dxf_entities(section, doc)):
+            for index, tags in enumerate(section):
+                entity = load(ExtendedTags(tags), doc)
                 handle = entity.dxf.get("handle")
                 if handle and handle in db:
                     logger.warning(
@@ -153,4 +157,4 @@ def load_and_bind_dxf_content(sections: dict, doc: Drawing) -> None:
                 # Replace Tags() by DXFEntity() objects
                 section[index] = entity
                 # Bind entities to the DXF document:
-                factory.bind(entity, doc)
+                bind(entity, doc)
@@ -282,6 +282,12 @@ def tag_compiler(tags: Iterator[DXFTag]) -> Iterator[DXFTag]:
     undo_tag: Optional[DXFTag] = None
     line: int = 0
     point: tuple[float, ...]
+    # localize globals and attributes
+    next_tag = iter(tags).__next__
+    point_codes = POINT_CODES
+    binary_data = BINARY_DATA
+    get_type = TYPE_TABLE.get
+    _DXFTag = DXFTag
     # Silencing mypy by "type: ignore", because this is a work horse function
     # and should not be slowed down by isinstance(...) checks or unnecessary
     # cast() calls
@@ -291,19 +297,19 @@ def tag_compiler(tags: Iterator[DXFTag]) -> Iterator[DXFTag]:
                 x = undo_tag
                 undo_tag = None
             else:
-                x = next(tags)
+                x = next_tag()
                 line += 2
             code: int = x.code
-            if code in POINT_CODES:
+            if code in point_codes:
                 # y-axis is mandatory
-                y = next(tags)
+                y = next_tag()
                 line += 2
                 if y.code != code + 10:  # like 20 for base x-code 10
                     raise DXFStructureError(
                         f"Missing required y coordinate near line: {line}."
                     )
                 # z-axis just for 3d points
-                z = next(tags)
+                z = next_tag()
                 line += 2
                 try:
                     # z-axis like (30, 0.0) for base x-code 10
@@ -317,7 +323,7 @@ def tag_compiler(tags: Iterator[DXFTag]) -> Iterator[DXFTag]:
                         f"Invalid floating point values near line: {line}."
                     )
                 yield DXFVertex(code, point)
-            elif code in BINARY_DATA:
+            elif code in binary_data:
                 # Maybe pre compiled in low level tagger (binary DXF):
                 if isinstance(x, DXFBinaryTag):
                     tag = x
@@ -336,12 +342,12 @@ def tag_compiler(tags: Iterator[DXFTag]) -> Iterator[DXFTag]:
                         value = x.value.strip()  # type: ignore
                     else:
                         value = x.value
-                    yield DXFTag(code, TYPE_TABLE.get(code, str)(value))
+                    yield _DXFTag(code, get_type(code, str)(value))
                 except ValueError:
                     # ProE stores int values as floats :((
-                    if TYPE_TABLE.get(code, str) is int:
+                    if get_type(code, str) is int:
                         try:
-                            yield DXFTag(code, int(float(x.value)))  # type: ignore
+                            yield _DXFTag(code, int(float(x.value)))  # type: ignore
                         except ValueError:
                             raise DXFStructureError(error_msg(x))
                     else:
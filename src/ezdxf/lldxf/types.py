@@ -206,7 +206,7 @@ class DXFTag:
 
     def dxfstr(self) -> str:
         """Returns the DXF string e.g. ``'  0\\nLINE\\n'``"""
-        return TAG_STRING_FORMAT % (self.code, self._value)
+        return TAG_STRING_FORMAT % (self._code, self._value)
 
     def clone(self) -> "DXFTag":
         """Returns a clone of itself, this method is necessary for the more
@@ -318,7 +318,11 @@ class DXFVertex(DXFTag):
 
     def dxfstr(self) -> str:
         """Returns the DXF string for all vertex components."""
-        return "".join(tag.dxfstr() for tag in self.dxftags())
+        c = self._code
+        return "".join(
+            TAG_STRING_FORMAT % (code, value)
+            for code, value in zip((c, c + 10, c + 20), self._value)
+        )
 
 
 class DXFBinaryTag(DXFTag):
@@ -6,7 +6,6 @@ from typing_extensions import Protocol
 from ezdxf.math import (
     Vec2,
     UVec,
-    intersection_line_line_2d,
     is_point_in_polygon_2d,
     has_clockwise_orientation,
     TOLERANCE,
@@ -96,29 +95,29 @@ class ClippingPolygon2d:
 
     def clip_line(self, start: Vec2, end: Vec2) -> Sequence[Vec2]:
         """Returns the clipped line."""
-
-        def is_inside(point: Vec2) -> bool:
-            # is point left of line:
-            return (clip_end.x - clip_start.x) * (point.y - clip_start.y) - (
-                clip_end.y - clip_start.y
-            ) * (point.x - clip_start.x) >= 0.0
-
-        def edge_intersection() -> Vec2:
-            return intersection_line_line_2d(
-                (edge_start, edge_end), (clip_start, clip_end)
-            )
-
         # The clipping polygon is always treated as a closed polyline!
         clip_start = self._clipping_polygon[-1]
         edge_start = start
         edge_end = end
         for clip_end in self._clipping_polygon:
-            if is_inside(edge_start):
-                if not is_inside(edge_end):
-                    edge_end = edge_intersection()
-            elif is_inside(edge_end):
-                if not is_inside(edge_start):
-                    edge_start = edge_intersection()
+            # The distances of the line vertices to the clipping edge scaled by
+            # the edge length, a vertex is inside if it is left of or on the
+            # clipping edge (distance >= 0).
+            sx = clip_start.x
+            sy = clip_start.y
+            dx = clip_end.x - sx
+            dy = clip_end.y - sy
+            start_dist = dx * (edge_start.y - sy) - dy * (edge_start.x - sx)
+            end_dist = dx * (edge_end.y - sy) - dy * (edge_end.x - sx)
+            if start_dist >= 0.0:
+                if end_dist < 0.0:
+                    edge_end = edge_start.lerp(
+                        edge_end, start_dist / (start_dist - end_dist)
+                    )
+            elif end_dist >= 0.0:
+                edge_start = edge_start.lerp(
+                    edge_end, start_dist / (start_dist - end_dist)
+                )
             else:
                 return tuple()
             clip_start = clip_end
@@ -126,41 +125,52 @@ class ClippingPolygon2d:
 
     def clip_polygon(self, polygon: Iterable[Vec2]) -> Sequence[Vec2]:
         """Returns the clipped polygon."""
-
-        def is_inside(point: Vec2) -> bool:
-            # is point left of line:
-            return (clip_end.x - clip_start.x) * (point.y - clip_start.y) - (
-                clip_end.y - clip_start.y
-            ) * (point.x - clip_start.x) > 0.0
-
-        def edge_intersection() -> Vec2:
-            return intersection_line_line_2d(
-                (edge_start, edge_end), (clip_start, clip_end)
-            )
-
         # The clipping polygon is always treated as a closed polyline!
         clip_start = self._clipping_polygon[-1]
         clipped = list(polygon)
+        # The vertex lists swap roles for each clipping edge, this avoids
+        # copying the clipped vertices:
+        vertices: list[Vec2] = []
         for clip_end in self._clipping_polygon:
             # next clipping edge to test: clip_start -> clip_end
             if not clipped:  # no subject vertices left to test
                 break
 
-            vertices = clipped.copy()
+            vertices, clipped = clipped, vertices
             if len(vertices) > 1 and vertices[0].isclose(vertices[-1]):
                 vertices.pop()
 
             clipped.clear()
+            # The distance of a vertex to the clipping edge scaled by the edge
+            # length is calculated once per vertex, a vertex is inside if it
+            # is left of the clipping edge (distance > 0).
+            sx = clip_start.x
+            sy = clip_start.y
+            dx = clip_end.x - sx
+            dy = clip_end.y - sy
             edge_start = vertices[-1]
+            start_dist = dx * (edge_start.y - sy) - dy * (edge_start.x - sx)
             for edge_end in vertices:
                 # next polygon edge to test: edge_start -> edge_end
-                if is_inside(edge_end):
-                    if not is_inside(edge_start):
-                        clipped.append(edge_intersection())
+                end_dist = dx * (edge_end.y - sy) - dy * (edge_end.x - sx)
+                if end_dist > 0.0:
+                    if start_dist <= 0.0:
+                        # The distances have different signs, the edge
+                        # intersects the clipping edge:
+                        clipped.append(
+                            edge_start.lerp(
+                                edge_end, start_dist / (start_dist - end_dist)
+                            )
+                        )
                     clipped.append(edge_end)
-                elif is_inside(edge_start):
-                    clipped.append(edge_intersection())
+                elif start_dist > 0.0:
+                    clipped.append(
+                        edge_start.lerp(
+                            edge_end, start_dist / (start_dist - end_dist)
+                        )
+                    )
                 edge_start = edge_end
+                start_dist = end_dist
             clip_start = clip_end
         return clipped
 
@@ -232,11 +232,13 @@ class ClassesSection:
 
     def add_class(self, name: str):
         """Register a known class by `name`."""
-        if name not in CLASS_DEFINITIONS:
+        cls_data = CLASS_DEFINITIONS.get(name)
+        if cls_data is None:
             return
-        cls_data = CLASS_DEFINITIONS[name]
-        cls = DXFClass.new(doc=self.doc)
         cpp, app, flags, proxy, entity = cls_data
+        if (name, cpp) in self.classes:
+            return  # already registered
+        cls = DXFClass.new(doc=self.doc)
         cls.update_dxf_attribs(
             {
                 "name": name,
@@ -249,6 +251,12 @@ class ClassesSection:
         )
         self.register(cls)
 
+    def add_classes(self, names: Iterable[str]) -> None:
+        """Register multiple known classes by `names`."""
+        add_class = self.add_class
+        for name in names:
+            add_class(name)
+
     def get(self, name: str) -> DXFClass:
         """Returns the first class matching `name`.
 
@@ -264,9 +272,7 @@ class ClassesSection:
 
     def add_required_classes(self, dxfversion: str) -> None:
         """Add all required CLASS definitions for the specified DXF version."""
-        names = REQUIRED_CLASSES.get(dxfversion, REQ_R2004)
-        for name in names:
-            self.add_class(name)
+        self.add_classes(REQUIRED_CLASSES.get(dxfversion, REQ_R2004))
 
         if self.doc is None:  # testing environment SUT
             return
@@ -298,8 +304,9 @@ class ClassesSection:
             self.add_class("SWEPTSURFACE")
             self.add_class("ACDBASSOCSWEPTSURFACEACTIONBODY")
 
-        for dxftype in dxf_types_in_use:
-            self.add_class(dxftype)
+        # Most DXF types in use have no CLASS definition, call add_class()
+        # only for known classes:
+        self.add_classes(dxf_types_in_use.intersection(CLASS_DEFINITIONS))
 
     def export_dxf(self, tagwriter: AbstractTagWriter) -> None:
         """Export DXF tags. (internal API)"""
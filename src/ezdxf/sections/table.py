@@ -128,6 +128,23 @@ class Table(Generic[T]):
         dxfattribs["owner"] = self._head.dxf.handle
         return self.new_entry(dxfattribs)
 
+    def ensure(self, name: str, dxfattribs=None) -> T:
+        """Returns table entry `name`, creates a new table entry if `name`
+        does not exist. (internal API)
+
+        Args:
+            name: name of table entry, case-insensitive
+            dxfattribs: additional DXF attributes for a new table entry
+
+        """
+        entry = self.entries.get(self.key(name))
+        if entry is not None:
+            return entry
+        dxfattribs = dict(dxfattribs or {})
+        dxfattribs["name"] = name
+        dxfattribs["owner"] = self._head.dxf.handle
+        return self.new_entry(dxfattribs)
+
     def get(self, name: str) -> T:
         """Returns table entry `name`.
 
@@ -352,6 +369,13 @@ class LayerTable(Table[Layer]):
             layer.set_required_attributes()
         return layer
 
+    def set_required_attributes(self) -> None:
+        """Set the required attributes of all layers. (internal API)"""
+        set_required_attributes = Layer.set_required_attributes
+        for layer in self.entries.values():
+            if layer.is_alive:
+                set_required_attributes(layer)
+
     def add(
         self,
         name: str,
@@ -607,6 +631,15 @@ class ViewportTable(Table[VPort]):
         dxfattribs["name"] = name
         return self.new_entry(dxfattribs)
 
+    def ensure(self, name: str, dxfattribs=None) -> VPort:
+        """Returns the first entry of the viewport configuration `name`,
+        creates a new table entry if `name` does not exist. (internal API)
+        """
+        entries = self.entries.get(self.key(name))
+        if entries:
+            return entries[0]  # type: ignore
+        return self.new(name, dict(dxfattribs or {}))
+
     def add(self, name: str, *, dxfattribs=None) -> VPort:
         """Add a new modelspace viewport entry. A modelspace viewport
         configuration can consist of multiple viewport entries with the same
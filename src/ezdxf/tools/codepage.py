@@ -76,6 +76,11 @@ encoding_to_codepage = {
 }
 
 
+_ansi_codepages = {
+    codec: "ANSI_" + ansi for codec, ansi in encoding_to_codepage.items()
+}
+
+
 def is_supported_encoding(encoding: str = "cp1252") -> bool:
     return encoding in encoding_to_codepage
 
@@ -88,4 +93,4 @@ def toencoding(dxfcodepage: str) -> str:
 
 
 def tocodepage(encoding: str) -> str:
-    return "ANSI_" + encoding_to_codepage.get(encoding, "1252")
+    return _ansi_codepages.get(encoding, "ANSI_1252")
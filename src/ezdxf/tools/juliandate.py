@@ -63,8 +63,14 @@ def frac2time(jdate) -> tuple[int, int, int]:
     return hour, minute, second
 
 
+# Julian date of the proleptic Gregorian ordinal 0, the results are the same
+# as the results of the JulianDate class:
+JULIAN_DATE_OF_ORDINAL_0 = 1721425.0
+
+
 def juliandate(date: datetime) -> float:
-    return JulianDate(date).result
+    seconds = date.hour * 3600.0 + date.minute * 60.0 + date.second
+    return date.toordinal() + JULIAN_DATE_OF_ORDINAL_0 + seconds / 86400.0
 
 
 def calendardate(juliandate: float) -> datetime:
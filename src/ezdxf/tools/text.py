@@ -17,6 +17,7 @@ from typing import (
 import enum
 import re
 import math
+from functools import lru_cache
 
 from ezdxf.lldxf import validator, const
 from ezdxf.enums import (
@@ -63,6 +64,8 @@ class TextLine:
         self._text_width: float = font.text_width(text)
         self._stretch_x: float = 1.0
         self._stretch_y: float = 1.0
+        # scaled font measurements, reset by stretch()
+        self._font_measurements: Optional[FontMeasurements] = None
 
     def stretch(self, alignment: TextEntityAlignment, p1: Vec3, p2: Vec3) -> None:
         """Set stretch factors for FIT and ALIGNED alignments to fit the
@@ -81,6 +84,7 @@ class TextLine:
                     sy = sx
         self._stretch_x = sx
         self._stretch_y = sy
+        self._font_measurements = None
 
     @property
     def width(self) -> float:
@@ -94,7 +98,11 @@ class TextLine:
 
     def font_measurements(self) -> FontMeasurements:
         """Returns the scaled font measurements."""
-        return self._font.measurements.scale(self._stretch_y)
+        fm = self._font_measurements
+        if fm is None:
+            fm = self._font.measurements.scale(self._stretch_y)
+            self._font_measurements = fm
+        return fm
 
     def baseline_vertices(
         self,
@@ -189,43 +197,48 @@ class TextLine:
         # This function doesn't transform many vertices at the same time,
         # mostly only 4 vertices, therefore the matrix multiplication overhead
         # does not pay off.
-        # The most expensive rotation transformation is the least frequently
-        # used transformation.
-        # IMPORTANT: these assumptions are not verified by profiling!
-
-        # Use 2D vectors:
-        vertices_: Iterable[Vec2] = Vec2.generate(vertices)
-
-        # 1. slanting at the original location (very rare):
-        if oblique:
-            slant_x = math.tan(oblique)
-            vertices_ = (Vec2(v.x + v.y * slant_x, v.y) for v in vertices_)
-
-        # 2. apply alignment shifting (frequently):
-        shift_vector = Vec2(shift)
-        if shift_vector:
-            vertices_ = (v + shift_vector for v in vertices_)
-
-        # 3. scale (and mirror) at the aligned location (more often):
+        # All transformation steps are applied to the float components of the
+        # vertices, creating intermediate Vec2 objects for each step costs more
+        # than the arithmetic itself. Sine and cosine of the rotation angle
+        # are calculated only once for all vertices.
+        slant_x = math.tan(oblique) if oblique else 0.0
+        shift_x, shift_y = shift
         scale_x, scale_y = scale
-        if scale_x != 1 or scale_y != 1:
-            vertices_ = (Vec2(v.x * scale_x, v.y * scale_y) for v in vertices_)
-
-        # 4. apply rotation (rare):
         if rotation:
-            vertices_ = (v.rotate(rotation) for v in vertices_)
+            cos_r = math.cos(rotation)
+            sin_r = math.sin(rotation)
+        else:
+            cos_r = 1.0
+            sin_r = 0.0
+        insert_x, insert_y, insert_z = Vec3(insert)
+        result: list[Vec3] = []
+        for v in Vec2.generate(vertices):
+            # 1. slanting at the original location (very rare)
+            # 2. apply alignment shifting (frequently)
+            # 3. scale (and mirror) at the aligned location (more often)
+            x = (v.x + v.y * slant_x + shift_x) * scale_x
+            y = (v.y + shift_y) * scale_y
+            # 4. apply rotation (rare)
+            # 5. move to insert location in OCS/3D! (every time)
+            result.append(
+                Vec3(
+                    insert_x + x * cos_r - y * sin_r,
+                    insert_y + x * sin_r + y * cos_r,
+                    insert_z,
+                )
+            )
+        return result
+
 
-        # 5. move to insert location in OCS/3D! (every time)
-        insert = Vec3(insert)
-        return [insert + v for v in vertices_]
+# shift factors for the horizontal alignments LEFT, CENTER and RIGHT:
+_SHIFT_X_FACTOR = (0.0, -0.5, -1.0)
 
 
 def _shift_x(total_width: float, halign: int) -> float:
-    if halign == CENTER:
-        return -total_width / 2.0
-    elif halign == RIGHT:
-        return -total_width
-    return 0.0  # LEFT
+    # loaded DXF data is not validated, invalid values are treated as LEFT
+    if 0 <= halign <= 2:
+        return total_width * _SHIFT_X_FACTOR[halign]
+    return 0.0
 
 
 def _shift_y(fm: FontMeasurements, valign: int) -> float:
@@ -277,27 +290,29 @@ def plain_text(text: str) -> str:
     # TEXT, ATTRIB and ATTDEF are short strings <= 255 in R12.
     # R2000 allows 2049 chars, but this limit is not often used in real world
     # applications.
-    result = ""
-    scanner = TextScanner(validator.fix_one_line_text(caret_decode(text)))
-    while scanner.has_data:
-        char = scanner.peek()
-        if char == "%":  # special characters
-            if scanner.peek(1) == "%":
-                code = scanner.peek(2).lower()
-                letter = const.SPECIAL_CHAR_ENCODING.get(code)
-                if letter:
-                    scanner.consume(3)  # %%?
-                    result += letter
-                    continue
-                elif code in "kou":
-                    # formatting codes (%%k, %%o, %%u) will be ignored in
-                    # TEXT, ATTRIB and ATTDEF:
-                    scanner.consume(3)
-                    continue
-        scanner.consume(1)
-        # slightly faster then "".join(chars)
-        result += char
-    return result
+    text = validator.fix_one_line_text(caret_decode(text))
+    if "%%" not in text:  # no special characters and no formatting codes
+        return text
+    result: list[str] = []
+    start = 0  # start of the next chunk of regular characters
+    index = text.find("%%")
+    while index != -1:
+        code = text[index + 2 : index + 3].lower()
+        letter = const.SPECIAL_CHAR_ENCODING.get(code)
+        if letter:
+            result.append(text[start:index])
+            result.append(letter)
+            start = index + 3  # %%?
+        elif code in "kou":
+            # formatting codes (%%k, %%o, %%u) will be ignored in
+            # TEXT, ATTRIB and ATTDEF:
+            result.append(text[start:index])
+            start = index + 3
+        else:  # the first '%' is just a regular character
+            index += 1
+        index = text.find("%%", max(index, start))
+    result.append(text[start:])
+    return "".join(result)
 
 
 ONE_CHAR_COMMANDS = "PNLlOoKkX"
@@ -433,16 +448,18 @@ def fast_plain_mtext(text: str, split=False) -> Union[list[str], str]:
         split: split content at line endings ``\\P``
 
     """
-    chars = []
-    # split text into chars, in reversed order for efficient pop()
-    raw_chars = list(reversed(caret_decode(text)))
-    while len(raw_chars):
-        char = raw_chars.pop()
+    chars: list[str] = []
+    text = caret_decode(text)
+    index = 0
+    length = len(text)
+    while index < length:
+        char = text[index]
+        index += 1
         if char == "\\":  # is a formatting command
-            try:
-                char = raw_chars.pop()
-            except IndexError:
+            if index >= length:
                 break  # premature end of text - just ignore
+            char = text[index]
+            index += 1
 
             if char in "\\{}":
                 chars.append(char)
@@ -454,28 +471,24 @@ def fast_plain_mtext(text: str, split=False) -> Union[list[str], str]:
                     # escape character
                     chars.append(" ")
                 # else: discard other commands
-            else:  # multiple character commands are terminated by ';'
-                stacking = char == "S"  # stacking command surrounds user data
-                first_char = char
-                search_chars = raw_chars.copy()
-                try:
-                    while char != ";":  # end of format marker
-                        char = search_chars.pop()
-                        if stacking and char != ";":
-                            # append user data of stacking command
-                            chars.append(char)
-                    raw_chars = search_chars
-                except IndexError:
+            elif char != ";":  # multiple character commands are terminated by ';'
+                end = text.find(";", index)  # end of format marker
+                if end == -1:
                     # premature end of text - just ignore
                     chars.append("\\")
-                    chars.append(first_char)
+                    chars.append(char)
+                    continue
+                if char == "S":  # stacking command surrounds user data
+                    chars.append(text[index:end])
+                index = end + 1
         elif char in "{}":  # grouping
             pass  # discard group markers
         elif char == "%":  # special characters
-            if len(raw_chars) and raw_chars[-1] == "%":
-                raw_chars.pop()  # discard next '%'
-                if len(raw_chars):
-                    code = raw_chars.pop()
+            if index < length and text[index] == "%":
+                index += 1  # discard next '%'
+                if index < length:
+                    code = text[index]
+                    index += 1
                     letter = const.SPECIAL_CHAR_ENCODING.get(code.lower())
                     if letter:
                         chars.append(letter)
@@ -498,12 +511,17 @@ def caret_decode(text: str) -> str:
     see: https://en.wikipedia.org/wiki/Caret_notation
 
     """
+    if "^" not in text:  # most strings do not contain caret notation
+        return text
+    return _CARET_NOTATION.sub(_decode_caret_match, text)
+
+
+_CARET_NOTATION = re.compile(r"\^(.)")
 
-    def replace_match(match: re.Match) -> str:
-        c = ord(match.group(1))
-        return chr((c - 64) % 126)
 
-    return re.sub(r"\^(.)", replace_match, text)
+def _decode_caret_match(match: re.Match) -> str:
+    c = ord(match.group(1))
+    return chr((c - 64) % 126)
 
 
 def split_mtext_string(s: str, size: int = 250) -> list[str]:
@@ -590,12 +608,27 @@ def escape_dxf_line_endings(text: str) -> str:
     return text.replace("\r", "").replace("\n", "\\P")
 
 
+# control characters except the tabulator
+_NON_PRINTABLE_CHARS = frozenset(chr(code) for code in range(32) if code != 9)
+
+
 def replace_non_printable_characters(text: str, replacement: str = "▯") -> str:
-    return "".join(replacement if is_non_printable_char(c) else c for c in text)
+    if text.isprintable():  # fast path: text has no control characters
+        return text
+    return text.translate(_non_printable_chars_table(replacement))
+
+
+@lru_cache(maxsize=16)
+def _non_printable_chars_table(replacement: str) -> dict[int, str]:
+    return {ord(char): replacement for char in _NON_PRINTABLE_CHARS}
 
 
 def is_non_printable_char(char: str) -> bool:
-    return 0 <= ord(char) < 32 and char != "\t"
+    return char in _NON_PRINTABLE_CHARS
+
+
+_split_lines = re.compile(r"(\n)").split
+_split_spaces = re.compile(r"(\s+)").split
 
 
 def text_wrap(
@@ -617,8 +650,8 @@ def text_wrap(
     # License: MIT License
     if not text or text.isspace():
         return []
-    manual_lines = re.split(r"(\n)", text)  # includes \n as its own token
-    tokens = [t for line in manual_lines for t in re.split(r"(\s+)", line) if t]
+    manual_lines = _split_lines(text)  # includes \n as its own token
+    tokens = [t for line in manual_lines for t in _split_spaces(line) if t]
     lines: list[str] = []
     current_line: str = ""
     line_just_wrapped = False
@@ -635,15 +668,19 @@ def text_wrap(
             if current_line or on_first_line:
                 current_line += t
         else:
-            if box_width is not None and get_text_width(current_line + t) > box_width:
-                if not current_line:
-                    current_line += t
-                else:
-                    lines.append(current_line.rstrip())
-                    current_line = t
-                    line_just_wrapped = True
+            line = current_line + t
+            # The first word of a line is never wrapped, no need to measure
+            # the text width:
+            if (
+                current_line
+                and box_width is not None
+                and get_text_width(line) > box_width
+            ):
+                lines.append(current_line.rstrip())
+                current_line = t
+                line_just_wrapped = True
             else:
-                current_line += t
+                current_line = line
 
     if current_line and not current_line.isspace():
         lines.append(current_line.rstrip())
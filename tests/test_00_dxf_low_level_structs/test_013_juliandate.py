@@ -4,7 +4,7 @@
 import pytest
 from datetime import datetime
 
-from ezdxf.tools.juliandate import juliandate, calendardate
+from ezdxf.tools.juliandate import juliandate, calendardate, JulianDate
 
 
 class TestJulianDate:
@@ -27,6 +27,18 @@ class TestJulianDate:
             juliandate(datetime(1999, 12, 31, 21, 58, 35))
         )
 
+    @pytest.mark.parametrize(
+        "date",
+        [
+            datetime(1582, 10, 4, 12, 30, 0),
+            datetime(1900, 2, 28, 23, 59, 59),
+            datetime(2000, 2, 29, 6, 0, 0),
+            datetime(2100, 3, 1, 1, 2, 3),
+        ],
+    )
+    def test_same_result_as_julian_date_class(self, date):
+        assert juliandate(date) == pytest.approx(JulianDate(date).result)
+
 
 class TestCalendarDate:
     def test_1999_12_31(self):
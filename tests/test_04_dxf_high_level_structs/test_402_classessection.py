@@ -68,6 +68,15 @@ def test_count_class_instances():
     assert instance_count("RASTERVARIABLES") == 1
 
 
+def test_add_classes_registers_known_classes_only_once():
+    section = ClassesSection()
+    section.add_classes(["IMAGE", "IMAGEDEF", "UNKNOWN_CLASS"])
+    image = section.get("IMAGE")
+    section.add_classes(["IMAGE", "IMAGEDEF"])
+    assert len(section.classes) == 2
+    assert section.get("IMAGE") is image, "expected the registered class"
+
+
 EMPTYSEC = """  0
 SECTION
   2
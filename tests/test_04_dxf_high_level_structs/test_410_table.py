@@ -124,6 +124,32 @@ def test_create_vport_table():
     assert len(doc.viewports) == 1
 
 
+def test_ensure_table_entry():
+    doc = ezdxf.new()
+    count = len(doc.appids)
+    appid = doc.appids.ensure("TEST_ENSURE", {"flags": 0})
+    assert len(doc.appids) == count + 1
+    assert doc.appids.ensure("test_ensure") is appid
+
+
+def test_ensure_viewport_config():
+    doc = ezdxf.new()
+    active = doc.viewports.get_config("*Active")[0]
+    assert doc.viewports.ensure("*Active") is active
+    assert len(doc.viewports) == 1
+
+
+def test_set_required_attributes_of_all_layers():
+    doc = ezdxf.new()
+    layer = doc.layers.add("TEST")
+    layer.dxf.discard("material_handle")
+    layer.dxf.discard("plotstyle_handle")
+
+    doc.layers.set_required_attributes()
+    assert layer.dxf.material_handle == doc.materials.get("Global").dxf.handle
+    assert layer.dxf.plotstyle_handle == doc.plotstyles["Normal"].dxf.handle
+
+
 AC1009TABLE = """0
 SECTION
 2
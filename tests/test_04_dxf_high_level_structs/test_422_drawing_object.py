@@ -136,6 +136,26 @@ def test_chain_layout_and_block(dwg_r12, dwg_r2000):
         assert check.intersection(handles) == check
 
 
+def test_universal_creation_time():
+    from datetime import datetime, timezone
+    from ezdxf.tools.juliandate import juliandate
+
+    doc = Drawing.new()
+    expected = juliandate(datetime.now(timezone.utc))
+    # tolerance of 1 minute
+    assert doc.header["$TDUCREATE"] == pytest.approx(expected, abs=1.0 / 1440.0)
+
+
+def test_create_blocks_while_iterating_chained_layouts():
+    doc = Drawing.new()
+    msp = doc.modelspace()
+    msp.add_point((0, 0))
+    msp.add_point((1, 0))
+    for index, _ in enumerate(doc.chain_layouts_and_blocks()):
+        doc.blocks.new(f"CHAIN_TEST_{index}")
+    assert "CHAIN_TEST_1" in doc.blocks
+
+
 def test_base64_encoding_r12(dwg_r12):
     data = dwg_r12.encode_base64()
     doc = decode_base64(data)
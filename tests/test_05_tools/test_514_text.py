@@ -54,6 +54,11 @@ class TestTextLine:
         # cap height * 1.333 * 1.5 = 4.99875
         assert text_line.height == 4.99875, "should stretch height"
 
+    def test_stretching_updates_font_measurements(self, text_line):
+        cap_height = text_line.font_measurements().cap_height
+        text_line.stretch(TextEntityAlignment.ALIGNED, Vec3(0, 0), Vec3(20, 0))
+        assert text_line.font_measurements().cap_height == cap_height * 2
+
     def test_baseline_vertices_left_aligned(self, text_line):
         assert text_line.baseline_vertices(Vec3(0, 0)) == [
             Vec3(0, 0),
@@ -72,6 +77,13 @@ class TestTextLine:
             Vec3(0, 0),
         ]
 
+    @pytest.mark.parametrize("halign", [-1, 7])
+    def test_invalid_halign_is_left_aligned(self, text_line, halign):
+        assert text_line.baseline_vertices(Vec3(0, 0), halign=halign) == [
+            Vec3(0, 0),
+            Vec3(10, 0),
+        ]
+
     def test_corner_vertices_baseline_aligned(self, text_line):
         fm = text_line.font_measurements()
         top = fm.cap_height
@@ -300,6 +312,10 @@ def test_plain_mtext2_removes_formatting():
     ), "invalid escape code is printed verbatim"
 
 
+def test_fast_plain_mtext_unterminated_stacking_command():
+    assert fast_plain_mtext(r"a\S1/2") == r"a\S1/2", "printed verbatim once"
+
+
 def test_remove_commands_without_terminating_semicolon():
     # single letter commands do not need a trailing semicolon:
     assert plain_mtext(r"\C1Text") == "Text"
@@ -2,6 +2,7 @@
 #  License: MIT License
 
 import pytest
+import struct
 from datetime import datetime
 from ezdxf.acis import sab
 
@@ -21,6 +22,17 @@ def test_decode_header(cube_sab):
     assert header.units_in_mm == 1.0
 
 
+@pytest.mark.parametrize("signature", sab.const.SIGNATURES)
+def test_all_signatures_have_the_same_length(signature):
+    # required by Decoder.read_header()
+    assert len(signature) == len(sab.const.ACIS_SIGNATURE)
+
+
+def test_decode_invalid_header():
+    with pytest.raises(sab.ParsingError):
+        sab.Decoder(b"SAT BinaryFile\x00").read_header()
+
+
 def test_encode_header(cube_sab):
     decoder = sab.Decoder(cube_sab)
     header = decoder.read_header()
@@ -56,6 +68,24 @@ def test_parse_sab(cube_sab):
     assert builder.entities[-1].name == "End-of-ASM-data"
 
 
+def test_parse_sab_from_memoryview(cube_sab):
+    builder = sab.parse_sab(memoryview(cube_sab))
+    assert len(builder.entities) == 116
+
+
+def test_parse_sab_requires_binary_data():
+    with pytest.raises(TypeError):
+        sab.parse_sab("ACIS BinaryFile")  # type: ignore
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 4])
+def test_decode_floats(count):
+    values = tuple(float(v) for v in range(count))
+    decoder = sab.Decoder(struct.pack(f"<{count}d", *values))
+    assert decoder.read_floats(count) == values
+    assert decoder.has_data is False
+
+
 class TestSabEntity:
     @pytest.fixture(scope="class")
     def builder(self, cube_sab):